@@ -1,66 +1,72 @@
-def decide(asset, score, signal_1_5d, signal_2_3w, macro_bias):
+import sys
 
-    # Text-Einordnung (nur Info)
-    gpt_1_5d = "Bullish" if signal_1_5d == "++" else "Bearish" if signal_1_5d == "--" else "Neutral"
-    gpt_2_3w = "Bullish" if signal_2_3w == "++" else "Bearish" if signal_2_3w == "--" else "Neutral"
+# Pro Asset: Liste von (Richtung, Schwelle, Aktion, Zusatzinfo),
+# in Prioritätsreihenfolge – die erste passende Regel gewinnt.
+# "GE": score >= Schwelle, "LE": score <= Schwelle.
+_RULES = {
+    "GOLD": (
+        ("GE", 0.53, "LONG", "Gold-Regel aktiv"),
+    ),
+    "SILVER": (
+        ("GE", 0.69, "LONG", "Silver-Regel aktiv"),
+    ),
+    "COPPER": (
+        ("GE", 0.56, "LONG", "Copper-Regel aktiv"),
+    ),
+    "NATURAL GAS": (
+        ("GE", 0.56, "LONG", "Gas LONG-Regel"),
+        ("LE", 0.44, "SHORT", "Gas SHORT-Regel"),
+    ),
+}
 
-    SIGNAL = "NO_TRADE"
-    FINAL = "NO_TRADE"
-    ZUSATZINFO = ""
+# Info-Text, wenn keine Regel greift
+_NO_TRADE_INFO = {
+    "GOLD": "Score unter Gold-Entry",
+    "SILVER": "Score unter Silver-Entry",
+    "COPPER": "Score unter Copper-Entry",
+    "NATURAL GAS": "Gas Neutralzone",
+}
 
-    # -----------------------------
-    # GOLD
-    # -----------------------------
-    if asset == "GOLD":
-        if score >= 0.53:
-            SIGNAL = "TRADE"
-            FINAL = "LONG"
-            ZUSATZINFO = "Gold-Regel aktiv"
-        else:
-            ZUSATZINFO = "Score unter Gold-Entry"
 
-    # -----------------------------
-    # SILVER
-    # -----------------------------
-    elif asset == "SILVER":
-        if score >= 0.69:
-            SIGNAL = "TRADE"
-            FINAL = "LONG"
-            ZUSATZINFO = "Silver-Regel aktiv"
-        else:
-            ZUSATZINFO = "Score unter Silver-Entry"
+def _make_decider(rules, no_trade_info):
+    # Spezialisiert die Regeln eines Assets in eine kleine Closure,
+    # damit decide() ohne String-Vergleichskette auskommt.
+    def _decide(score):
+        for op, threshold, action, info in rules:
+            if (op == "GE" and score >= threshold) or (op == "LE" and score <= threshold):
+                return "TRADE", action, info
+        return "NO_TRADE", "NO_TRADE", no_trade_info
+    return _decide
 
-    # -----------------------------
-    # COPPER
-    # -----------------------------
-    elif asset == "COPPER":
-        if score >= 0.56:
-            SIGNAL = "TRADE"
-            FINAL = "LONG"
-            ZUSATZINFO = "Copper-Regel aktiv"
-        else:
-            ZUSATZINFO = "Score unter Copper-Entry"
 
-    # -----------------------------
-    # NATURAL GAS
-    # -----------------------------
-    elif asset == "NATURAL GAS":
-        if score >= 0.56:
-            SIGNAL = "TRADE"
-            FINAL = "LONG"
-            ZUSATZINFO = "Gas LONG-Regel"
-        elif score <= 0.44:
-            SIGNAL = "TRADE"
-            FINAL = "SHORT"
-            ZUSATZINFO = "Gas SHORT-Regel"
-        else:
-            ZUSATZINFO = "Gas Neutralzone"
+def _decide_default(score):
+    return "NO_TRADE", "NO_TRADE", ""
 
-    return {
-    "rule_signal": SIGNAL,     # TRADE / NO_TRADE
-    "action": FINAL,           # LONG / SHORT / NO_TRADE
-    "gpt_1_5d": gpt_1_5d,
-    "gpt_2_3w": gpt_2_3w,
-    "zusatzinfo": ZUSATZINFO
-}
 
+# Asset -> spezialisierte Entscheidungsfunktion (einmal beim Import gebaut)
+_DECIDERS = {a: _make_decider(r, _NO_TRADE_INFO[a]) for a, r in _RULES.items()}
+
+# GOLD ist das meistgehandelte Asset: interniertes Literal erlaubt den
+# Pointer-Vergleich (is) vor dem Dict-Lookup
+_GOLD = sys.intern("GOLD")
+_GOLD_DECIDER = _DECIDERS[_GOLD]
+
+
+def decide(asset, score, signal_1_5d, signal_2_3w, macro_bias):
+
+    # Text-Einordnung (nur Info)
+    gpt_1_5d = "Bullish" if signal_1_5d == "++" else "Bearish" if signal_1_5d == "--" else "Neutral"
+    gpt_2_3w = "Bullish" if signal_2_3w == "++" else "Bearish" if signal_2_3w == "--" else "Neutral"
+
+    if asset is _GOLD:
+        SIGNAL, FINAL, ZUSATZINFO = _GOLD_DECIDER(score)
+    else:
+        SIGNAL, FINAL, ZUSATZINFO = _DECIDERS.get(asset, _decide_default)(score)
+
+    return {
+        "rule_signal": SIGNAL,     # TRADE / NO_TRADE
+        "action": FINAL,           # LONG / SHORT / NO_TRADE
+        "gpt_1_5d": gpt_1_5d,
+        "gpt_2_3w": gpt_2_3w,
+        "zusatzinfo": ZUSATZINFO
+    }
@@ -1,3 +1,9 @@
+import functools
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import numpy as np
 import yfinance as yf
 import pandas as pd
 
@@ -14,47 +20,104 @@ ASSETS = [
     ("COPPER", "HG=F", "STRONG_SUPPORT"),
 ]
 
+# Gemeinsames Gerüst für alle Fallback-Zeilen (Guard-Block / Fehler);
+# die Aufrufer überschreiben nur asset, final und zusatzinfo.
+_BLOCK_TEMPLATE = {
+    "asset": "NA",
+    "close": None,
+    "score": 0.0,
+    "signal": "NO_TRADE",
+    "f_1_5": 0.0,
+    "f_2_3": 0.0,
+    "gpt_1_5d": "NA",
+    "gpt_2_3w": "NA",
+    "final": "NO_TRADE",
+    "zusatzinfo": "",
+    "data_ok": False,
+}
+
+
+# Bereits normalisierte Frames (id -> weakref); DataFrames sind nicht
+# hashbar, daher id-Keys mit Identitätscheck über die weakref
+_NORMALIZED: dict = {}
+
 
 def _normalize_yfinance_df(df: pd.DataFrame) -> pd.DataFrame:
+    ref = _NORMALIZED.get(id(df))
+    if ref is not None and ref() is df:
+        return df
+
     if isinstance(df.columns, pd.MultiIndex):
         df.columns = df.columns.get_level_values(0)
-    return df
-
-
-def _last_scalar(df, col):
-    v = df[col].iloc[-1]
-    if isinstance(v, pd.Series):
-        v = v.dropna().iloc[0] if not v.dropna().empty else v.iloc[0]
-    return float(v)
 
+    if len(_NORMALIZED) > 64:
+        _NORMALIZED.clear()
+    _NORMALIZED[id(df)] = weakref.ref(df)
+    return df
 
-def forecast_asset(asset, ticker, macro_bias):
 
-    df = yf.download(ticker, period="6mo", interval="1d", progress=False)
+def _download_bulk(tickers, period="6mo"):
+    """Ein einziger yfinance-Request für alle Ticker statt N einzelner."""
+    try:
+        bulk = yf.download(
+            " ".join(tickers),
+            period=period,
+            interval="1d",
+            group_by="ticker",
+            threads=True,
+            progress=False,
+        )
+    except Exception:
+        return {}
+
+    if bulk is None or bulk.empty:
+        return {}
+
+    out = {}
+    if isinstance(bulk.columns, pd.MultiIndex):
+        level0 = set(bulk.columns.get_level_values(0))
+        for t in tickers:
+            if t in level0:
+                # Fehlgeschlagene Ticker liefern reine NaN-Spalten;
+                # leere Slices weglassen, damit der Einzel-Nachlader
+                # in forecast_asset greift
+                sliced = bulk[t].dropna(how="all")
+                if not sliced.empty:
+                    out[t] = sliced
+    elif len(tickers) == 1:
+        sliced = bulk.dropna(how="all")
+        if not sliced.empty:
+            out[tickers[0]] = sliced
+    return out
+
+
+def forecast_asset(asset, ticker, macro_bias, df=None, now_utc=None):
+
+    if df is None:
+        df = yf.download(ticker, period="6mo", interval="1d", progress=False)
     df = _normalize_yfinance_df(df)
 
-    guard = guard_dataframe(asset, df)
+    guard = guard_dataframe(asset, df, now_utc=now_utc)
 
     if not guard.data_ok:
         return {
+            **_BLOCK_TEMPLATE,
             "asset": asset,
-            "close": None,
-            "score": 0.0,
-            "signal": "NO_TRADE",
-            "f_1_5": 0.0,
-            "f_2_3": 0.0,
-            "gpt_1_5d": "NA",
-            "gpt_2_3w": "NA",
             "final": "NO_TRADE(DATA)",
             "zusatzinfo": guard.reason,
             **guard.to_dict()
         }
 
-    close = round(_last_scalar(df, "Close"), 1)
+    # Close einmal als zusammenhängendes Array ziehen, alle
+    # numerischen Konsumenten arbeiten darauf statt über pandas
+    close_arr = df["Close"].to_numpy(dtype=np.float64, copy=False)
+    if close_arr.ndim > 1:
+        close_arr = close_arr[:, 0]
 
-    score = model_score(df)
-    f_1_5 = forecast_trend(df, days=5)
-    f_2_3 = forecast_trend(df, days=15)
+    close = round(float(close_arr[-1]), 1)
+
+    score = model_score(close_arr)
+    f_1_5, f_2_3 = forecast_trend(close_arr, days=(5, 15))
 
     decision = decide(
         asset=asset,
@@ -79,23 +142,38 @@ def forecast_asset(asset, ticker, macro_bias):
     }
 
 
+def _forecast_safe(spec, df=None, now_utc=None):
+    asset, ticker, macro_bias = spec
+    try:
+        return forecast_asset(asset, ticker, macro_bias, df=df, now_utc=now_utc)
+    except Exception as e:
+        return {
+            **_BLOCK_TEMPLATE,
+            "asset": asset,
+            "final": "NO_TRADE(ERROR)",
+            "zusatzinfo": str(e),
+        }
+
+
+# Pro Asset eine beim Import gebundene Forecast-Funktion; run_all reicht
+# nur noch die laufzeitabhängigen Argumente (df, now_utc) durch
+_FORECASTERS = [
+    (ticker, functools.partial(_forecast_safe, (asset, ticker, macro_bias)))
+    for asset, ticker, macro_bias in ASSETS
+]
+
+
 def run_all():
-    results = []
-    for asset, ticker, macro_bias in ASSETS:
-        try:
-            results.append(forecast_asset(asset, ticker, macro_bias))
-        except Exception as e:
-            results.append({
-                "asset": asset,
-                "close": None,
-                "score": 0.0,
-                "signal": "NO_TRADE",
-                "f_1_5": 0.0,
-                "f_2_3": 0.0,
-                "gpt_1_5d": "NA",
-                "gpt_2_3w": "NA",
-                "final": "NO_TRADE(ERROR)",
-                "zusatzinfo": str(e),
-                "data_ok": False
-            })
-    return results
+    # Alle Ticker in einem HTTP-Request; bei Fehlschlag lädt
+    # forecast_asset den fehlenden Ticker einzeln nach.
+    bulk = _download_bulk([t for t, _ in _FORECASTERS])
+
+    # Eine Uhrzeit für alle Guards, statt pro Asset neu zu lesen
+    now_utc = datetime.now(timezone.utc)
+
+    with ThreadPoolExecutor(max_workers=len(_FORECASTERS)) as pool:
+        futures = [
+            pool.submit(fn, df=bulk.get(ticker), now_utc=now_utc)
+            for ticker, fn in _FORECASTERS
+        ]
+        return [f.result() for f in futures]
@@ -1,6 +1,6 @@
 from metals_bundle import load_gold
 from forecast_utils import model_score, forecast_trend, trade_signal
-from datetime import datetime
+from datetime import datetime, timezone
 
 
 
@@ -15,7 +15,7 @@ def gold_result():
 
     return {
         "asset": "GOLD",
-        "date": datetime.utcnow().strftime("%Y-%m-%d"),
+        "date": datetime.now(timezone.utc).strftime("%Y-%m-%d"),
         "close": f"{close:.2f} USD/oz",
         "model_score": f"{score:.2%}",
         "signal": trade_signal(score),
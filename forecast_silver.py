@@ -2,7 +2,7 @@
 
 from metals_bundle import load_silver
 from forecast_utils import model_score, forecast_trend, trade_signal
-from datetime import datetime
+from datetime import datetime, timezone
 
 def silver_result():
     df = load_silver()
@@ -12,7 +12,7 @@ def silver_result():
 
     return {
         "asset": "SILVER",
-        "date": datetime.utcnow().strftime("%Y-%m-%d"),
+        "date": datetime.now(timezone.utc).strftime("%Y-%m-%d"),
         "close": f"{close:.2f} USD/oz",
         "model_score": f"{score:.2%}",
         "signal": trade_signal(score),
@@ -1,15 +1,34 @@
+import numpy as np
 import pandas as pd
 
 
-def forecast_trend(df, days=5) -> float:
-    close = df["Close"]
+def _close_array(data) -> np.ndarray:
+    # Nimmt ndarray direkt, sonst Close aus DataFrame/Series ziehen
+    if isinstance(data, np.ndarray):
+        return data
 
-    # Robust gegen Series ODER DataFrame
-    if isinstance(close, pd.DataFrame):
-        last = float(close.iloc[-1, 0])
-        past = float(close.iloc[-days, 0])
-    else:
-        last = float(close.iloc[-1])
-        past = float(close.iloc[-days])
+    if isinstance(data, pd.DataFrame):
+        close = data["Close"]
+        if isinstance(close, pd.DataFrame):
+            close = close.iloc[:, 0]
+        return close.to_numpy(dtype=np.float64)
 
+    return np.asarray(data, dtype=np.float64)
+
+
+def forecast_trend(data, days=5):
+    """
+    days als int -> ein Trendwert, als Tuple/Liste -> Tuple von
+    Trendwerten; das Close-Array wird dabei nur einmal extrahiert.
+    """
+    close = _close_array(data)
+    last = float(close[-1])
+
+    if isinstance(days, (tuple, list)):
+        return tuple(
+            round((last - float(close[-d])) / float(close[-d]), 4)
+            for d in days
+        )
+
+    past = float(close[-days])
     return round((last - past) / past, 4)
@@ -1,9 +1,85 @@
+import math
+
 import numpy as np
 import pandas as pd
 
-def compute_score(prices) -> float:
+# Numba ist optional: mit JIT läuft der numerische Kern als
+# kompilierter Maschinencode, ohne als normales Python.
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def deco(fn):
+            return fn
+        return deco
+
+
+# Konstanten der Momentum-Normalisierung (einmal beim Import)
+_SQRT20 = math.sqrt(20.0)
+_SQRT5 = math.sqrt(5.0)
+
+
+@njit(cache=True, fastmath=True)
+def _score_core(p):
+    """Numerischer Kern von SCORE V2 – erwartet 1-D float64 Array."""
+
+    # ---------- SAFETY ----------
+    # p <= 0 mit abfangen: math.log würde im Python-Fallback einen
+    # ValueError werfen, wo np.log früher still nan lieferte
+    if len(p) < 30 or np.any(~np.isfinite(p)) or np.any(p <= 0.0):
+        return 0.50
+
+    # ---------- RETURNS ----------
+    r_20 = (p[-1] - p[-21]) / p[-21]
+    r_5  = (p[-1] - p[-6])  / p[-6]
+
+    # ---------- VOLATILITY ----------
+    # Ein Durchlauf mit Summe/Quadratsumme statt np.diff/np.log/np.std
+    # (keine temporären Arrays, Ergebnis identisch zu np.std ddof=0)
+    n = len(p)
+    s = 0.0
+    s2 = 0.0
+    prev = math.log(p[n - 21])
+    for i in range(n - 20, n):
+        cur = math.log(p[i])
+        r = cur - prev
+        prev = cur
+        s += r
+        s2 += r * r
+
+    mean = s / 20.0
+    var = s2 / 20.0 - mean * mean
+    if var < 0.0:
+        var = 0.0
+
+    vol = math.sqrt(var)
+    if not math.isfinite(vol) or vol < 1e-6:
+        return 0.50
+
+    # ---------- NORMALIZED MOMENTUM ----------
+    m20 = r_20 / (vol * _SQRT20)
+    m5  = r_5  / (vol * _SQRT5)
+
+    core = (
+        0.65 * math.tanh(m20 * 0.8) +
+        0.35 * math.tanh(m5  * 1.2)
+    )
+
+    return 0.5 + core * 0.25
+
+
+# JIT einmal beim Import anwärmen, damit der Compile nicht den ersten
+# echten Score-Aufruf trifft (ohne Numba ein billiger No-Op-Durchlauf)
+_score_core(np.ones(30, dtype=np.float64))
+
+
+def compute_score_raw(prices) -> float:
     """
-    SCORE V2 – fully robust, production safe
+    SCORE V2 ohne Display-Rundung – für enge Loops (Backtests), die den
+    Score pro Bar brauchen und erst am Ende formatieren.
     """
 
     # ---------- INPUT NORMALIZATION ----------
@@ -26,37 +102,21 @@ def compute_score(prices) -> float:
         p = prices.values
 
     else:
-        p = np.asarray(prices)
+        # kein eigenes asarray hier – die finale Konvertierung unten
+        # reicht und kopiert float64-Input nicht erneut
+        p = prices
 
     # ---------- FORCE 1D FLOAT ARRAY ----------
-    p = np.asarray(p, dtype=float).reshape(-1)
-
-    # ---------- SAFETY ----------
-    if len(p) < 30 or np.any(~np.isfinite(p)):
-        return 0.50
+    p = np.asarray(p, dtype=np.float64).reshape(-1)
 
-    # ---------- RETURNS ----------
-    r_20 = (p[-1] - p[-21]) / p[-21]
-    r_5  = (p[-1] - p[-6])  / p[-6]
+    return float(_score_core(p))
 
-    # ---------- VOLATILITY ----------
-    rets = np.diff(np.log(p[-21:]))
 
-    vol = np.std(rets)
-    if not np.isfinite(vol) or vol < 1e-6:
-        return 0.50
-
-    # ---------- NORMALIZED MOMENTUM ----------
-    m20 = r_20 / (vol * np.sqrt(20))
-    m5  = r_5  / (vol * np.sqrt(5))
-
-    core = (
-        0.65 * np.tanh(m20 * 0.8) +
-        0.35 * np.tanh(m5  * 1.2)
-    )
-
-    score = 0.5 + core * 0.25
-    return float(np.round(score, 3))
+def compute_score(prices) -> float:
+    """
+    SCORE V2 – fully robust, production safe
+    """
+    return round(compute_score_raw(prices), 3)
 
 
 # backward compatibility
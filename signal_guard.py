@@ -1,13 +1,17 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+import math
+import time
+import weakref
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Optional, Tuple, Dict, Any
 
+import numpy as np
 import pandas as pd
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GuardResult:
     asset: str
     data_ok: bool
@@ -20,9 +24,36 @@ class GuardResult:
     stale: int
     timeframe_s: int
     reason: str
+    # strukturierte Codes; reason bleibt der abwärtskompatible Join
+    reasons: Tuple[str, ...] = ()
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Explizites Literal statt asdict: gleiche Keys, aber ohne den
+        # rekursiven deepcopy-Apparat von dataclasses.asdict
+        return {
+            "asset": self.asset,
+            "data_ok": self.data_ok,
+            "last_bar_utc": self.last_bar_utc,
+            "last_bar_utc_display": self.last_bar_utc_display,
+            "age_s": self.age_s,
+            "age_h": self.age_h,
+            "rows": self.rows,
+            "nan_last": self.nan_last,
+            "stale": self.stale,
+            "timeframe_s": self.timeframe_s,
+            "reason": self.reason,
+            "reasons": self.reasons,
+        }
+
+
+# Interned Reason-Codes: Konsumenten können auf .reasons matchen,
+# statt den Join-String wieder zu splitten
+_R_EMPTY_DF = "EMPTY_DF"
+_R_MISSING_COLS = "MISSING_COLS"
+_R_HISTORY_SHORT = "HISTORY_SHORT"
+_R_STALE_DATA = "STALE_DATA"
+_R_NAN_LAST_ROW = "NAN_LAST_ROW"
+_R_BAD_INDEX = "BAD_INDEX"
 
 
 def _safe_int(x, default: int = 0) -> int:
@@ -32,6 +63,12 @@ def _safe_int(x, default: int = 0) -> int:
         return default
 
 
+# Memo für wiederholte Guards auf demselben Index (id -> (weakref, tf));
+# die weakref bestätigt die Identität, weil CPython ids von toten
+# Objekten wiederverwendet. Begrenzte Größe gegen Leaks.
+_TF_CACHE: Dict[int, tuple] = {}
+
+
 def infer_timeframe_seconds(index: pd.Index, fallback_seconds: int = 86400) -> int:
     try:
         if not isinstance(index, pd.DatetimeIndex):
@@ -39,18 +76,30 @@ def infer_timeframe_seconds(index: pd.Index, fallback_seconds: int = 86400) -> i
         if len(index) < 3:
             return fallback_seconds
 
+        hit = _TF_CACHE.get(id(index))
+        if hit is not None and hit[0]() is index:
+            return hit[1]
+
         n = min(len(index), 50)
-        idx = index[-n:]
-        deltas = (idx[1:] - idx[:-1]).to_series().dt.total_seconds().dropna()
 
-        if deltas.empty:
+        # Ein numpy-Diff statt TimedeltaIndex -> Series -> total_seconds;
+        # Division durch timedelta64(1s) ist unabhängig von der Einheit
+        deltas = np.diff(index[-n:].to_numpy()) / np.timedelta64(1, "s")
+        deltas = deltas[deltas > 0]
+
+        if deltas.size == 0:
             return fallback_seconds
 
-        tf = int(round(float(deltas.median())))
+        tf = int(round(float(np.median(deltas))))
         if tf <= 0:
             return fallback_seconds
 
-        return max(1, min(tf, 7 * 86400))
+        tf = max(1, min(tf, 7 * 86400))
+
+        if len(_TF_CACHE) > 128:
+            _TF_CACHE.clear()
+        _TF_CACHE[id(index)] = (weakref.ref(index), tf)
+        return tf
     except Exception:
         return fallback_seconds
 
@@ -71,6 +120,65 @@ def _format_display(dt_utc: datetime) -> str:
     return dt_utc.strftime("%Y-%m-%d %H:%M")
 
 
+def guard_many(
+    items: Dict[str, Optional[pd.DataFrame]],
+    *,
+    now_utc: Optional[datetime] = None,
+    **kwargs,
+) -> list:
+    """
+    Guards für ein ganzes Portfolio {asset: df} mit einer einzigen
+    gemeinsamen Uhrzeit; spart pro Asset den Clock-Read und hält alle
+    Alters-/Staleness-Werte auf demselben Zeitpunkt.
+    """
+    if now_utc is None:
+        now_utc = datetime.now(timezone.utc)
+
+    return [
+        guard_dataframe(asset, df, now_utc=now_utc, **kwargs)
+        for asset, df in items.items()
+    ]
+
+
+def is_data_ok(
+    df: Optional[pd.DataFrame],
+    *,
+    min_rows: int = 30,
+    timeframe_seconds: Optional[int] = None,
+    max_stale_multiplier: int = 2,
+    now_utc: Optional[datetime] = None,
+) -> bool:
+    """
+    Schneller Ja/Nein-Check in Billig-zuerst-Reihenfolge (Länge, Index,
+    Staleness, NaN) ohne GuardResult, Strings oder Reason-Liste.
+    guard_dataframe bleibt der volle Audit-Pfad.
+    """
+    if df is None or len(df) < min_rows:
+        return False
+
+    if not isinstance(df.index, pd.DatetimeIndex):
+        return False
+
+    tf = timeframe_seconds if timeframe_seconds else infer_timeframe_seconds(df.index)
+
+    last = df.index[-1]
+    if last.tzinfo is None:
+        last = last.tz_localize(timezone.utc)
+
+    now_ts = time.time() if now_utc is None else now_utc.timestamp()
+    if now_ts - last.timestamp() > tf * max_stale_multiplier:
+        return False
+
+    if "Close" not in df.columns:
+        return False
+
+    v = df["Close"].to_numpy()[-1]
+    try:
+        return not math.isnan(float(v))
+    except (TypeError, ValueError):
+        return False
+
+
 def guard_dataframe(
     asset: str,
     df: Optional[pd.DataFrame],
@@ -92,32 +200,42 @@ def guard_dataframe(
             asset, False, "NA", "NA",
             10**9, float(10**9)/3600, 0, 1, 1,
             _safe_int(timeframe_seconds, 0),
-            "EMPTY_DF"
+            _R_EMPTY_DF,
+            (_R_EMPTY_DF,),
         )
 
     rows = len(df)
-    reasons = []
+    # OK-Pfad bleibt beim leeren Tuple-Singleton, keine Liste pro Call
+    reasons: Tuple[str, ...] = ()
     data_ok = True
 
-    missing = [c for c in required_cols if c not in df.columns]
+    # Spaltenmembership einmal als Set (O(1) statt Index.__contains__);
+    # MultiIndex nur einmal erkennen und für den NaN-Check mitbenutzen
+    cols = df.columns
+    is_multi = cols.nlevels > 1
+    cols_set = frozenset(cols.get_level_values(0)) if is_multi else frozenset(cols)
+
+    missing = [c for c in required_cols if c not in cols_set]
     if missing:
         data_ok = False
-        reasons.append("MISSING_COLS")
+        reasons += (_R_MISSING_COLS,)
 
     if rows < min_rows:
         data_ok = False
-        reasons.append("HISTORY_SHORT")
+        reasons += (_R_HISTORY_SHORT,)
 
     try:
+        # pd.Timestamp direkt weiterverwenden: liefert timestamp() für
+        # die Altersrechnung und strftime() für die Anzeige, ohne den
+        # Umweg über to_pydatetime()
         last_bar = df.index[-1]
-        if isinstance(last_bar, pd.Timestamp):
-            last_bar = last_bar.to_pydatetime()
     except Exception:
         return GuardResult(
             asset, False, "NA", "NA",
             10**9, float(10**9)/3600, rows, 1, 1,
             _safe_int(timeframe_seconds, 0),
-            "BAD_INDEX"
+            _R_BAD_INDEX,
+            (_R_BAD_INDEX,),
         )
 
     if last_bar.tzinfo is None:
@@ -125,27 +243,52 @@ def guard_dataframe(
 
     last_bar_utc = last_bar.astimezone(timezone.utc)
 
-    tf = timeframe_seconds if timeframe_seconds else infer_timeframe_seconds(df.index)
-    tf = _safe_int(tf, 86400)
+    # _safe_int nur noch für den user-übergebenen Wert; die Inferenz
+    # liefert garantiert ein int
+    if timeframe_seconds:
+        tf = _safe_int(timeframe_seconds, 86400)
+    else:
+        tf = infer_timeframe_seconds(df.index)
 
-    age_s = _safe_int((now_utc - last_bar_utc).total_seconds(), 10**9)
+    # Epoch-Subtraktion statt timedelta-Objekt (beide Seiten sind aware)
+    age_s = int(now_utc.timestamp() - last_bar_utc.timestamp())
     age_h = round(age_s / 3600.0, 2)
 
     stale = 1 if age_s > tf * max_stale_multiplier else 0
     if stale:
         data_ok = False
-        reasons.append("STALE_DATA")
-
-    nan_last = 0
-    for c in critical_last_cols:
-        v = _last_scalar(df, c)
-        if v is None or pd.isna(v):
+        reasons += (_R_STALE_DATA,)
+
+    if is_multi:
+        # MultiIndex: Spaltenzugriff bleibt beim robusten Einzel-Lookup
+        nan_last = 0
+        for c in critical_last_cols:
+            # Set-Lookup statt Exception in _last_scalar bei fehlender Spalte
+            if c not in cols_set:
+                nan_last = 1
+                break
+            v = _last_scalar(df, c)
+            if v is None or pd.isna(v):
+                nan_last = 1
+                break
+    else:
+        # Flache Spalten: letzte Zeile einmal als ndarray lesen;
+        # fehlende kritische Spalten zählen wie bisher als NaN
+        present = [c for c in critical_last_cols if c in cols_set]
+        if len(present) < len(critical_last_cols):
             nan_last = 1
-            break
+        else:
+            last = df.iloc[-1:][present].to_numpy()
+            if last.size == 0:
+                nan_last = 1
+            elif last.dtype == object:
+                nan_last = int(bool(pd.isna(last).any()))
+            else:
+                nan_last = int(bool(np.isnan(last).any()))
 
     if nan_last:
         data_ok = False
-        reasons.append("NAN_LAST_ROW")
+        reasons += (_R_NAN_LAST_ROW,)
 
     return GuardResult(
         asset,
@@ -159,4 +302,5 @@ def guard_dataframe(
         stale,
         tf,
         "OK" if data_ok else ";".join(reasons),
+        reasons,
     )
@@ -38,17 +38,22 @@ def _to_date(s: str):
         return None
 
 
-def record_signals(results: list[dict], asset_to_ticker: dict[str, str]) -> None:
+def record_signals(results: list[dict], asset_to_ticker) -> None:
     """
     Speichert die heutigen FINAL-Signale (LONG/SHORT/NO_TRADE/NO_TRADE(DATA)).
     Nur wenn DATA_OK=True und FINAL in {LONG,SHORT} wird als "Trade-Signal" geloggt.
+
+    asset_to_ticker: Dict oder Sequenz von (asset, ticker)-Paaren.
     """
     rows = []
     now_utc = _utc_now_str()
 
+    # Einmal in ein Dict auflösen, egal wie der Caller es übergibt
+    ticker_map = dict(asset_to_ticker)
+
     for r in results:
         asset = r.get("asset", "NA")
-        ticker = asset_to_ticker.get(asset)
+        ticker = ticker_map.get(asset)
         if not ticker:
             continue
 
@@ -104,7 +109,7 @@ def record_signals(results: list[dict], asset_to_ticker: dict[str, str]) -> None
     df_all.to_csv(TRADE_LOG_FILE, index=False)
 
 
-def evaluate_open_trades(asset_to_ticker: dict[str, str], horizon_days: int = 5) -> dict:
+def evaluate_open_trades(asset_to_ticker, horizon_days: int = 5) -> dict:
     """
     Bewertet alle offenen Signale aus trade_log.csv:
     - LONG richtig, wenn Close(t+h) > Close(t)